@@ -2,17 +2,481 @@
 uvroot - Root package for data processing and API interaction
 Uses numpy for data processing and requests for HTTP operations
 """
+import bisect
+import csv
+import json
+import math
+import os
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+MAX_WORKERS = 16
+MAX_CONNECTIONS_PER_HOST = 4
+MAX_HOST_POOLS = 128
+HEAD_REJECTED_STATUSES = (405, 501)
+CACHE_TTL = 300
+CACHE_MAX_ENTRIES = 4096
+REPORT_BUFFER_SIZE = 1 << 16
+REPORT_FIELDS = ('status', 'avg', 'total')
+LATENCY_PHASES = ('pool_wait', 'dns', 'connect', 'tls', 'ttfb', 'total')
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+def build_latency_buckets(min_seconds=1e-4, max_seconds=60.0, growth=1.1):
+    """Build log-spaced histogram bucket upper bounds"""
+    buckets = []
+    bound = min_seconds
+    while bound < max_seconds:
+        buckets.append(bound)
+        bound *= growth
+    buckets.append(max_seconds)
+    return buckets
+
+
+LATENCY_BUCKETS = build_latency_buckets()
+
+# Phase timings for the probe running on the current thread
+probe_timings = threading.local()
+
+
+def record_phase(phase, seconds):
+    """Record a phase duration for the probe running on this thread"""
+    timings = getattr(probe_timings, 'current', None)
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + seconds
+
+
+def probe_timing_active():
+    """Check whether the current thread is timing a probe"""
+    return getattr(probe_timings, 'current', None) is not None
+
+
+class TimedConnectionMixin:
+    """Record DNS, TCP connect and TLS handshake time for new connections"""
+
+    def _new_conn(self):
+        if not probe_timing_active():
+            return super()._new_conn()
+
+        # Resolve once here and connect to the resolved addresses, so the
+        # connect phase never includes a second lookup
+        host = self._dns_host
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(host.strip('[]'), self.port,
+                                           allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            record_phase('dns', time.perf_counter() - start)
+            raise NameResolutionError(self.host, self, e) from e
+        record_phase('dns', time.perf_counter() - start)
+
+        start = time.perf_counter()
+        error = NewConnectionError(self, 'getaddrinfo returned no addresses')
+        try:
+            for address in addresses:
+                self._dns_host = address[4][0]
+                try:
+                    return super()._new_conn()
+                except ConnectTimeoutError as e:
+                    error = e
+            raise error
+        finally:
+            self._dns_host = host
+            record_phase('connect', time.perf_counter() - start)
+
+    def connect(self):
+        timings = getattr(probe_timings, 'current', None)
+        if timings is None:
+            return super().connect()
+        before = timings.get('dns', 0.0) + timings.get('connect', 0.0)
+        start = time.perf_counter()
+        super().connect()
+        elapsed = time.perf_counter() - start
+        if isinstance(self, HTTPSConnection):
+            socket_time = timings.get('dns', 0.0) + timings.get('connect', 0.0) - before
+            record_phase('tls', max(elapsed - socket_time, 0.0))
+
+    def getresponse(self, *args, **kwargs):
+        # Time from the request being sent to the response headers arriving
+        if not probe_timing_active():
+            return super().getresponse(*args, **kwargs)
+        start = time.perf_counter()
+        response = super().getresponse(*args, **kwargs)
+        record_phase('ttfb', time.perf_counter() - start)
+        return response
+
+
+class TimedHTTPConnection(TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedPoolMixin:
+    """Record time spent waiting for a free pooled connection"""
+
+    def _get_conn(self, timeout=None):
+        start = time.perf_counter()
+        conn = super()._get_conn(timeout=timeout)
+        record_phase('pool_wait', time.perf_counter() - start)
+        return conn
+
+
+class TimedHTTPConnectionPool(TimedPoolMixin, HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(TimedPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTP adapter whose connection pools report per-phase timings"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with bounded memory"""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        """Add one observation"""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q):
+        """Return the bucket upper bound holding the q-th percentile"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for idx, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if idx < len(LATENCY_BUCKETS):
+                    return min(LATENCY_BUCKETS[idx], self.max)
+                return self.max
+        return self.max
+
+    def to_dict(self):
+        """Summarize the histogram"""
+        summary = {
+            'count': self.count,
+            'mean': self.sum / self.count if self.count else 0.0,
+            'max': self.max,
+        }
+        for q in LATENCY_PERCENTILES:
+            summary[f'p{q}'] = self.percentile(q)
+        return summary
+
+
+class LatencyRecorder:
+    """Per-request probe timings aggregated into per-host histograms"""
+
+    def __init__(self, keep_records=False):
+        self.keep_records = keep_records
+        self.records = []
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def record(self, url, timings, status=None, size=0, error=None):
+        """Record one probe"""
+        host = urlsplit(url).netloc
+        error_class = type(error).__name__ if error is not None else None
+        with self.lock:
+            stats = self.hosts.get(host)
+            if stats is None:
+                stats = {'count': 0, 'bytes': 0, 'errors': {}, 'phases': {}}
+                self.hosts[host] = stats
+            stats['count'] += 1
+            stats['bytes'] += size
+            if error_class:
+                stats['errors'][error_class] = stats['errors'].get(error_class, 0) + 1
+            for phase, seconds in timings.items():
+                histogram = stats['phases'].get(phase)
+                if histogram is None:
+                    histogram = stats['phases'][phase] = LatencyHistogram()
+                histogram.add(seconds)
+            if self.keep_records:
+                self.records.append({
+                    'url': url,
+                    'status': status,
+                    'size': size,
+                    'error': error_class,
+                    **timings,
+                })
+
+    def to_dict(self):
+        """Summarize per-host histograms (and raw records if kept)"""
+        with self.lock:
+            hosts = {
+                host: {
+                    'count': stats['count'],
+                    'bytes': stats['bytes'],
+                    'errors': dict(stats['errors']),
+                    'phases': {
+                        phase: stats['phases'][phase].to_dict()
+                        for phase in LATENCY_PHASES
+                        if phase in stats['phases']
+                    },
+                }
+                for host, stats in self.hosts.items()
+            }
+            data = {'hosts': hosts}
+            if self.keep_records:
+                data['records'] = list(self.records)
+        return data
+
+    def export_json(self, path):
+        """Write the latency summary to a JSON file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def print_summary(self):
+        """Print p50/p95/p99 total latency per host"""
+        for host, stats in self.to_dict()['hosts'].items():
+            total = stats['phases'].get('total')
+            if total is None:
+                continue
+            errors = sum(stats['errors'].values())
+            print(f"  {host}: n={stats['count']}, p50={total['p50'] * 1000:.1f}ms, "
+                  f"p95={total['p95'] * 1000:.1f}ms, p99={total['p99'] * 1000:.1f}ms, errors={errors}")
+
+
+def latency_report_path(report_path):
+    """Return the latency JSON path that sits next to a report file"""
+    return os.path.splitext(report_path)[0] + '.latency.json'
+
+
+def create_session(max_connections_per_host=MAX_CONNECTIONS_PER_HOST, max_hosts=MAX_HOST_POOLS):
+    """Create a keep-alive HTTP session with bounded per-host connections"""
+    session = requests.Session()
+    # Keep enough host pools that busy ones are not evicted and closed mid-probe
+    adapter = TimedHTTPAdapter(pool_connections=max_hosts, pool_maxsize=max_connections_per_host,
+                               pool_block=True)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def use_timed_adapter(session):
+    """Swap a session's plain HTTP adapters for timed ones with the same pool settings"""
+    for prefix in ('http://', 'https://'):
+        adapter = session.get_adapter(prefix)
+        if type(adapter) is HTTPAdapter:
+            session.mount(prefix, TimedHTTPAdapter(
+                pool_connections=adapter._pool_connections,
+                pool_maxsize=adapter._pool_maxsize,
+                max_retries=adapter.max_retries,
+                pool_block=adapter._pool_block,
+            ))
+    return session
 
 
-def fetch_data_from_api(url):
+class ProbeCache:
+    """LRU cache of probe responses with TTL and conditional revalidation"""
+
+    def __init__(self, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, path=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = path
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.load()
+
+    def lookup(self, url):
+        """Return (entry, is_fresh) for a URL, or (None, False) if uncached"""
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            self.entries.move_to_end(url)
+            if time.time() - entry['fetched_at'] < self.ttl:
+                self.hits += 1
+                return entry, True
+            return entry, False
+
+    def conditional_headers(self, entry):
+        """Build If-None-Match / If-Modified-Since headers for a stale entry"""
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, response):
+        """Store a fresh response and evict the least recently used entries"""
+        entry = {
+            'status': response.status_code,
+            'content_type': response.headers.get('content-type', 'unknown'),
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'fetched_at': time.time(),
+        }
+        with self.lock:
+            self.entries[url] = entry
+            self.entries.move_to_end(url)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return entry
+
+    def record_miss(self):
+        """Count a stale entry that had to be fetched again"""
+        with self.lock:
+            self.misses += 1
+
+    def refresh(self, url, entry, response):
+        """Extend a cached entry after a 304 Not Modified response"""
+        with self.lock:
+            entry['fetched_at'] = time.time()
+            entry['etag'] = response.headers.get('etag', entry.get('etag'))
+            entry['last_modified'] = response.headers.get('last-modified', entry.get('last_modified'))
+            self.revalidated += 1
+        return entry
+
+    def stats(self):
+        """Return hit/miss counters"""
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidated': self.revalidated,
+                'entries': len(self.entries),
+            }
+
+    def load(self):
+        """Load cached entries from the on-disk store"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        with self.lock:
+            self.entries = OrderedDict(data)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def save(self):
+        """Write cached entries to the on-disk store"""
+        if not self.path:
+            return
+        with self.lock:
+            data = list(self.entries.items())
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+def probe_headers(client, url, headers=None):
+    """Fetch only response headers, falling back to a streamed GET if HEAD is rejected"""
+    response = client.head(url, timeout=5, allow_redirects=True, headers=headers)
+    if response.status_code in HEAD_REJECTED_STATUSES:
+        response = client.get(url, timeout=5, stream=True, headers=headers)
+        # Drop the connection before any body bytes are read
+        response.close()
+    return response
+
+
+def content_length(response):
+    """Return the body size a response declares, or 0 if it declares none"""
+    try:
+        return int(response.headers.get('content-length', 0))
+    except ValueError:
+        return 0
+
+
+def fetch_data_from_api(url, session=None, head_only=False, cache=None, recorder=None):
     """Fetch data from a REST API"""
+    entry = None
+    headers = None
+    if cache is not None:
+        entry, is_fresh = cache.lookup(url)
+        if is_fresh:
+            return entry['status'], entry['content_type']
+        headers = cache.conditional_headers(entry)
+    # A stale entry is a revalidation on 304 and a miss on any other outcome
+    stale = entry is not None
+    revalidated = False
+
+    # Phase timings only come from timed adapters, so make sure one handles the probe
+    owns_session = session is None and recorder is not None
+    if owns_session:
+        session = create_session()
+    elif recorder is not None:
+        use_timed_adapter(session)
+    client = session if session is not None else requests
+
+    timings = {} if recorder is not None else None
+    probe_timings.current = timings
+    start = time.perf_counter()
+    response = None
+    error = None
     try:
-        response = requests.get(url, timeout=5)
+        if head_only:
+            response = probe_headers(client, url, headers=headers)
+        else:
+            response = client.get(url, timeout=5, headers=headers)
+
+        if cache is not None:
+            if response.status_code == 304 and entry is not None:
+                entry = cache.refresh(url, entry, response)
+                revalidated = True
+            else:
+                entry = cache.store(url, response)
+            return entry['status'], entry['content_type']
         return response.status_code, response.headers.get('content-type', 'unknown')
     except Exception as e:
+        error = e
         print(f"Error fetching data: {e}")
         return None, None
+    finally:
+        probe_timings.current = None
+        if stale and not revalidated:
+            cache.record_miss()
+        if recorder is not None:
+            timings['total'] = time.perf_counter() - start
+            status = None
+            size = 0
+            if response is not None:
+                status = response.status_code
+                size = content_length(response) if head_only else len(response.content)
+            recorder.record(url, timings, status=status, size=size, error=error)
+        if owns_session:
+            session.close()
 
 
 def process_api_response(status_code):
@@ -27,25 +491,97 @@ def process_api_response(status_code):
         return "Unknown"
 
 
-def calculate_metrics(a, b, c):
-    """Calculate various metrics"""
-    average = (a + b + c) / 3
-    total = a + b + c
-    maximum = max(a, b, c)
-    minimum = min(a, b, c)
+def calculate_metrics(*values):
+    """Calculate various metrics over a series, or row-wise over a 2-D batch"""
+    if len(values) == 1 and np.ndim(values[0]) > 0:
+        data = np.asarray(values[0])
+    else:
+        data = np.asarray(values)
+
+    axis = -1 if data.ndim > 1 else None
+    total = data.sum(axis=axis)
+    if data.size == 0:
+        # Empty series have no average or extremes; report NaN instead of raising
+        average = maximum = minimum = np.full(total.shape, np.nan)
+    else:
+        average = data.mean(axis=axis)
+        maximum = data.max(axis=axis)
+        minimum = data.min(axis=axis)
+
+    if axis is None:
+        return average.item(), total.item(), maximum.item(), minimum.item()
     return average, total, maximum, minimum
 
 
-def analyze_data(url, values):
-    """Analyze data from multiple sources"""
-    status, content_type = fetch_data_from_api(url)
+def calculate_batch_metrics(values):
+    """Calculate metrics per row, in one vectorized pass when rows share a length"""
+    if len({len(row) for row in values}) == 1:
+        avg, total, max_val, min_val = calculate_metrics(np.asarray(values))
+        return list(zip(avg.tolist(), total.tolist(), max_val.tolist(), min_val.tolist()))
+    return [calculate_metrics(row) for row in values]
+
+
+def summarize_analysis(status, content_type, metrics, verbose=True):
+    """Combine a probe response with its metrics"""
     result = process_api_response(status) if status else "Error"
-    avg, total, max_val, min_val = calculate_metrics(*values)
-    print(f"API Status: {result}, Content-Type: {content_type}")
-    print(f"  Metrics - Avg: {avg:.2f}, Total: {total}, Max: {max_val}, Min: {min_val}")
+    avg, total, max_val, min_val = metrics
+    if verbose:
+        print(f"API Status: {result}, Content-Type: {content_type}")
+        print(f"  Metrics - Avg: {avg:.2f}, Total: {total}, Max: {max_val}, Min: {min_val}")
     return result, avg, total
 
 
+def analyze_data(url, values, session=None, head_only=False, cache=None, verbose=True,
+                 recorder=None):
+    """Analyze data from multiple sources"""
+    status, content_type = fetch_data_from_api(url, session=session, head_only=head_only,
+                                               cache=cache, recorder=recorder)
+    return summarize_analysis(status, content_type, calculate_metrics(values), verbose=verbose)
+
+
+def iter_analyses(urls, values, max_workers=MAX_WORKERS, session=None, head_only=False,
+                  cache=None, verbose=True, recorder=None,
+                  max_connections_per_host=MAX_CONNECTIONS_PER_HOST):
+    """Analyze many URLs concurrently, yielding results in input order"""
+    urls = list(urls)
+    if not isinstance(values, np.ndarray):
+        values = list(values)
+    if len(urls) != len(values):
+        raise ValueError(f"Got {len(urls)} URLs but {len(values)} value sets")
+
+    metrics = calculate_batch_metrics(values)
+    owns_session = session is None
+    if owns_session:
+        session = create_session(max_connections_per_host,
+                                 max_hosts=max(MAX_HOST_POOLS, max_workers))
+    elif recorder is not None:
+        use_timed_adapter(session)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = executor.map(
+                lambda url: fetch_data_from_api(url, session=session, head_only=head_only,
+                                                cache=cache, recorder=recorder),
+                urls,
+            )
+            for (status, content_type), row_metrics in zip(responses, metrics):
+                yield summarize_analysis(status, content_type, row_metrics, verbose=verbose)
+    finally:
+        if owns_session:
+            session.close()
+        if cache is not None:
+            cache.save()
+
+
+def analyze_many(urls, values, max_workers=MAX_WORKERS, session=None, head_only=False,
+                 cache=None, verbose=True, recorder=None,
+                 max_connections_per_host=MAX_CONNECTIONS_PER_HOST):
+    """Analyze many URLs concurrently, returning results in input order"""
+    return list(iter_analyses(urls, values, max_workers=max_workers, session=session,
+                              head_only=head_only, cache=cache, verbose=verbose,
+                              recorder=recorder,
+                              max_connections_per_host=max_connections_per_host))
+
+
 def validate_data(data_results):
     """Validate the data results"""
     valid_count = sum(1 for r in data_results if r[0] == "Success")
@@ -53,7 +589,14 @@ def validate_data(data_results):
     return valid_count, total_count
 
 
-def generate_report(data_results):
+def print_cache_stats(cache):
+    """Print probe cache hit/miss counters"""
+    stats = cache.stats()
+    print(f"Cache: {stats['hits']} hits, {stats['misses']} misses, "
+          f"{stats['revalidated']} revalidated, {stats['entries']} entries")
+
+
+def generate_report(data_results, cache=None, recorder=None, latency_path=None):
     """Generate a summary report"""
     print("\n=== Report Summary ===")
     for idx, result in enumerate(data_results):
@@ -61,6 +604,106 @@ def generate_report(data_results):
     
     valid, total = validate_data(data_results)
     print(f"\nValidation: {valid}/{total} successful")
+    if cache is not None:
+        print_cache_stats(cache)
+    if recorder is not None:
+        print("Latency (total):")
+        recorder.print_summary()
+        if latency_path:
+            recorder.export_json(latency_path)
+    return total
+
+
+class ReportSink:
+    """Single-pass report aggregator that streams results to an NDJSON or CSV file"""
+
+    def __init__(self, path=None, fmt='ndjson', buffer_size=REPORT_BUFFER_SIZE):
+        if fmt not in ('ndjson', 'csv'):
+            raise ValueError(f"Unsupported report format: {fmt}")
+        self.path = path
+        self.fmt = fmt
+        self.valid_count = 0
+        self.total_count = 0
+        self.avg_sum = 0.0
+        self.total_sum = 0
+        self.file = None
+        self.writer = None
+        if path:
+            self.file = open(path, 'w', encoding='utf-8', newline='', buffering=buffer_size)
+            if fmt == 'csv':
+                self.writer = csv.writer(self.file)
+                self.writer.writerow(REPORT_FIELDS)
+
+    def add(self, result):
+        """Aggregate one result and append it to the output file"""
+        status, avg, total = result[0], result[1], result[2]
+        self.total_count += 1
+        if status == "Success":
+            self.valid_count += 1
+        self.avg_sum += avg
+        self.total_sum += total
+
+        if self.writer is not None:
+            self.writer.writerow((status, avg, total))
+        elif self.file is not None:
+            self.file.write(json.dumps(dict(zip(REPORT_FIELDS, (status, avg, total)))))
+            self.file.write('\n')
+
+    def extend(self, results):
+        """Aggregate an iterable of results"""
+        for result in results:
+            self.add(result)
+        return self.total_count
+
+    def summary(self):
+        """Return the aggregated counts, totals and averages"""
+        count = self.total_count
+        return {
+            'valid': self.valid_count,
+            'count': count,
+            'total': self.total_sum,
+            'mean_avg': self.avg_sum / count if count else 0.0,
+            'mean_total': self.total_sum / count if count else 0.0,
+        }
+
+    def print_summary(self, cache=None):
+        """Print a short human-readable summary"""
+        stats = self.summary()
+        print("\n=== Report Summary ===")
+        print(f"Validation: {stats['valid']}/{stats['count']} successful")
+        print(f"Mean Avg: {stats['mean_avg']:.2f}, Mean Total: {stats['mean_total']:.2f}")
+        if self.path:
+            print(f"Results written to {self.path}")
+        if cache is not None:
+            print_cache_stats(cache)
+
+    def close(self):
+        """Flush and close the output file"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def stream_report(data_results, path=None, fmt='ndjson', cache=None, verbose=True,
+                  recorder=None):
+    """Aggregate results in one pass, writing them to a file instead of stdout"""
+    with ReportSink(path, fmt=fmt) as sink:
+        total = sink.extend(data_results)
+        if verbose:
+            sink.print_summary(cache=cache)
+    if recorder is not None:
+        if verbose:
+            print("Latency (total):")
+            recorder.print_summary()
+        if path:
+            recorder.export_json(latency_report_path(path))
     return total
 
 
@@ -70,10 +713,13 @@ def main():
     print("Processing data and generating reports...\n")
     
     # Execute functions
-    results = []
-    results.append(analyze_data("https://api.github.com", (10, 20, 30)))
-    results.append(analyze_data("https://httpbin.org/status/200", (5, 15, 25)))
-    results.append(analyze_data("https://www.python.org", (8, 12, 18)))
+    urls = [
+        "https://api.github.com",
+        "https://httpbin.org/status/200",
+        "https://www.python.org",
+    ]
+    values = [(10, 20, 30), (5, 15, 25), (8, 12, 18)]
+    results = analyze_many(urls, values, head_only=True)
     
     report_count = generate_report(results)
     print(f"\n✓ Processed {report_count} analyses")
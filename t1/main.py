@@ -1,6 +1,12 @@
 """
 t1 - Array operations and matrix computations using numpy
 """
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+
 try:
     import numpy as np
     HAS_NUMPY = True
@@ -8,52 +14,186 @@ except ImportError:
     HAS_NUMPY = False
     print("Warning: numpy not available")
 
+try:
+    from threadpoolctl import threadpool_limits
+    HAS_THREADPOOLCTL = True
+except ImportError:
+    HAS_THREADPOOLCTL = False
+
+DEFAULT_TILE_SIZE = 1024
+STATS_CHUNK_ELEMENTS = 1 << 20
+BLAS_THREAD_ENV_VARS = (
+    'OMP_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'VECLIB_MAXIMUM_THREADS',
+    'NUMEXPR_NUM_THREADS',
+)
+
+
+def make_rng(seed=None):
+    """Create a seeded random number generator"""
+    return np.random.default_rng(seed)
 
-def create_matrix(rows, cols):
-    """Create a random matrix"""
+
+def accumulate_dtype(dtype):
+    """Return the dtype used to accumulate products of `dtype` values"""
+    dtype = np.dtype(dtype)
+    return np.dtype(np.float32) if dtype == np.float16 else dtype
+
+
+def random_block(rng, shape, dtype):
+    """Draw uniform [0, 1) values of the requested dtype"""
+    if np.dtype(dtype) in (np.float32, np.float64):
+        return rng.random(shape, dtype=dtype)
+    return rng.random(shape, dtype=np.float32).astype(dtype)
+
+
+def create_matrix(rows, cols, path=None, dtype=None, rng=None, seed=None):
+    """Create a random matrix, optionally backed by a memory-mapped file"""
     if HAS_NUMPY:
-        return np.random.rand(rows, cols)
+        dtype = np.dtype(dtype or np.float64)
+        if rng is None:
+            rng = make_rng(seed)
+        if path is None:
+            return random_block(rng, (rows, cols), dtype)
+        matrix = np.memmap(path, dtype=dtype, mode='w+', shape=(rows, cols))
+        # Fill in row blocks so only one block is resident at a time
+        block_rows = max(1, DEFAULT_TILE_SIZE * DEFAULT_TILE_SIZE // max(cols, 1))
+        for start in range(0, rows, block_rows):
+            stop = min(start + block_rows, rows)
+            matrix[start:stop] = random_block(rng, (stop - start, cols), dtype)
+        matrix.flush()
+        return matrix
     else:
         return [[0] * cols for _ in range(rows)]
 
 
-def matrix_multiply(a, b):
+def open_matrix(path, rows, cols, mode='r', dtype=None):
+    """Open an existing memory-mapped matrix"""
+    return np.memmap(path, dtype=dtype or np.float64, mode=mode, shape=(rows, cols))
+
+
+def blocked_matrix_multiply(a, b, tile_size=DEFAULT_TILE_SIZE, out_path=None, out=None):
+    """Multiply two matrices tile by tile, optionally into a memory-mapped output"""
+    rows, inner = a.shape
+    inner_b, cols = b.shape
+    if inner != inner_b:
+        raise ValueError(f"Incompatible shapes for multiply: {a.shape} and {b.shape}")
+
+    dtype = np.result_type(a.dtype, b.dtype)
+    acc_dtype = accumulate_dtype(dtype)
+    if out is not None:
+        if out.shape != (rows, cols):
+            raise ValueError(f"Output buffer has shape {out.shape}, expected {(rows, cols)}")
+        product = out
+    elif out_path is not None:
+        product = np.memmap(out_path, dtype=dtype, mode='w+', shape=(rows, cols))
+    else:
+        product = np.empty((rows, cols), dtype=dtype)
+
+    for i in range(0, rows, tile_size):
+        i_end = min(i + tile_size, rows)
+        for j in range(0, cols, tile_size):
+            j_end = min(j + tile_size, cols)
+            tile = np.zeros((i_end - i, j_end - j), dtype=acc_dtype)
+            for k in range(0, inner, tile_size):
+                k_end = min(k + tile_size, inner)
+                tile += np.dot(a[i:i_end, k:k_end].astype(acc_dtype, copy=False),
+                               b[k:k_end, j:j_end].astype(acc_dtype, copy=False))
+            product[i:i_end, j:j_end] = tile
+
+    if isinstance(product, np.memmap):
+        product.flush()
+    return product
+
+
+def matrix_multiply(a, b, tile_size=None, out_path=None, out=None):
     """Multiply two matrices"""
     if HAS_NUMPY:
-        return np.dot(a, b)
+        use_blocked = (
+            tile_size is not None
+            or out_path is not None
+            or isinstance(a, np.memmap)
+            or isinstance(b, np.memmap)
+        )
+        if use_blocked:
+            return blocked_matrix_multiply(a, b, tile_size=tile_size or DEFAULT_TILE_SIZE,
+                                           out_path=out_path, out=out)
+
+        acc_dtype = accumulate_dtype(np.result_type(a.dtype, b.dtype))
+        if a.dtype != acc_dtype or b.dtype != acc_dtype:
+            # float16 has no BLAS kernel; multiply in float32 and cast back
+            product = np.matmul(a.astype(acc_dtype), b.astype(acc_dtype))
+            if out is None:
+                return product.astype(np.result_type(a.dtype, b.dtype))
+            out[...] = product
+            return out
+        return np.matmul(a, b, out=out)
     else:
         return a  # Fallback
 
 
+def chunked_statistics(matrix, chunk_elements=STATS_CHUNK_ELEMENTS):
+    """Compute mean, std and sum in one pass, merging per-chunk moments"""
+    data = np.asarray(matrix)
+    if data.size == 0:
+        return float('nan'), float('nan'), 0.0
+    rows = data.reshape(data.shape[0], -1) if data.ndim > 1 else data.reshape(-1, 1)
+    step = max(1, chunk_elements // max(rows.shape[1], 1))
+
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    total = 0.0
+    for start in range(0, rows.shape[0], step):
+        chunk = rows[start:start + step]
+        n = chunk.size
+        chunk_sum = float(chunk.sum(dtype=np.float64))
+        chunk_mean = chunk_sum / n
+        deviations = np.subtract(chunk, chunk_mean, dtype=np.float64).ravel()
+        chunk_m2 = float(np.dot(deviations, deviations))
+
+        # Chan et al. pairwise merge of (count, mean, M2)
+        delta = chunk_mean - mean
+        merged = count + n
+        mean += delta * n / merged
+        m2 += chunk_m2 + delta * delta * count * n / merged
+        total += chunk_sum
+        count = merged
+
+    return mean, (m2 / count) ** 0.5, total
+
+
 def compute_statistics(matrix):
     """Compute matrix statistics"""
     if HAS_NUMPY:
-        mean = np.mean(matrix)
-        std = np.std(matrix)
-        sum_val = np.sum(matrix)
+        mean, std, sum_val = chunked_statistics(matrix)
         return mean, std, sum_val
     else:
         return 0, 0, 0
 
 
-def process_matrix(matrix):
+def process_matrix(matrix, transpose=True):
     """Process matrix with various operations"""
     mean, std, sum_val = compute_statistics(matrix)
     print(f"Matrix stats: mean={mean:.3f}, std={std:.3f}, sum={sum_val:.3f}")
     
-    if HAS_NUMPY:
-        transposed = np.transpose(matrix)
-        return transposed, mean, std
+    if HAS_NUMPY and transpose:
+        # .T is a strided view; nothing is copied until the caller reads it
+        return matrix.T, mean, std
+    elif HAS_NUMPY:
+        return None, mean, std
     else:
         return matrix, mean, std
 
 
-def linear_algebra_ops(matrix1, matrix2):
+def linear_algebra_ops(matrix1, matrix2, tile_size=None, out_path=None, out=None):
     """Perform linear algebra operations"""
     if HAS_NUMPY:
-        product = matrix_multiply(matrix1, matrix2)
-        trans1, mean1, std1 = process_matrix(matrix1)
-        trans2, mean2, std2 = process_matrix(matrix2)
+        product = matrix_multiply(matrix1, matrix2, tile_size=tile_size, out_path=out_path, out=out)
+        _, mean1, std1 = process_matrix(matrix1, transpose=False)
+        _, mean2, std2 = process_matrix(matrix2, transpose=False)
         
         print(f"Product shape: {product.shape}")
         return product, mean1, mean2
@@ -71,20 +211,106 @@ def validate_matrices(matrices):
     return valid
 
 
-def run_analysis(size):
+def run_analysis(size, tile_size=None, workdir=None, dtype=None, rng=None, out=None):
     """Run complete matrix analysis"""
     print(f"\n--- Analysis with {size}x{size} matrices ---")
     
-    m1 = create_matrix(size, size)
-    m2 = create_matrix(size, size)
+    if HAS_NUMPY and rng is None:
+        rng = make_rng()
+    if workdir is not None:
+        m1 = create_matrix(size, size, path=os.path.join(workdir, f"m1_{size}.dat"), dtype=dtype, rng=rng)
+        m2 = create_matrix(size, size, path=os.path.join(workdir, f"m2_{size}.dat"), dtype=dtype, rng=rng)
+        out_path = os.path.join(workdir, f"product_{size}.dat")
+    else:
+        m1 = create_matrix(size, size, dtype=dtype, rng=rng)
+        m2 = create_matrix(size, size, dtype=dtype, rng=rng)
+        out_path = None
     
     if validate_matrices([m1, m2]):
-        product, mean1, mean2 = linear_algebra_ops(m1, m2)
+        product, mean1, mean2 = linear_algebra_ops(m1, m2, tile_size=tile_size, out_path=out_path, out=out)
         print(f"Means: matrix1={mean1:.3f}, matrix2={mean2:.3f}")
         return product
     return None
 
 
+@contextmanager
+def blas_thread_env(threads):
+    """Temporarily set BLAS thread limits inherited by newly spawned processes"""
+    saved = {var: os.environ.get(var) for var in BLAS_THREAD_ENV_VARS}
+    for var in BLAS_THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+    try:
+        yield
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def limit_blas_threads(threads):
+    """Cap BLAS threads in an already running process"""
+    if HAS_THREADPOOLCTL:
+        threadpool_limits(limits=threads, user_api='blas')
+
+
+def blas_thread_limit(threads):
+    """Context manager capping BLAS threads in this process while it is active"""
+    if HAS_THREADPOOLCTL:
+        return threadpool_limits(limits=threads, user_api='blas')
+    return nullcontext()
+
+
+def batched_matmul(size, count, seed=None, dtype=None):
+    """Multiply `count` pairs of size x size matrices with one batched matmul"""
+    dtype = np.dtype(dtype or np.float64)
+    rng = make_rng(seed)
+    m1 = random_block(rng, (count, size, size), dtype)
+    m2 = random_block(rng, (count, size, size), dtype)
+    start = time.perf_counter()
+    np.matmul(m1, m2)
+    elapsed = time.perf_counter() - start
+    return size, count, elapsed
+
+
+def run_batch_analysis(sizes, max_workers=None, blas_threads=1, seed=None, dtype=None):
+    """Run stacked same-size multiplies, spreading sizes across a process pool"""
+    if not HAS_NUMPY:
+        print("Numpy not available - limited functionality")
+        return []
+
+    groups = {}
+    for size in sizes:
+        groups[size] = groups.get(size, 0) + 1
+
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // blas_threads)
+    max_workers = min(max_workers, len(groups))
+    # One child seed per size group, so results do not depend on scheduling
+    seeds = np.random.SeedSequence(seed).spawn(len(groups))
+    dtypes = [dtype] * len(groups)
+
+    if max_workers <= 1:
+        # BLAS is already loaded here, so the env vars would have no effect
+        with blas_thread_limit(blas_threads):
+            timings = list(map(batched_matmul, groups.keys(), groups.values(), seeds, dtypes))
+    else:
+        # Spawned workers load BLAS fresh, so they pick up the thread env vars
+        context = multiprocessing.get_context('spawn')
+        with blas_thread_env(blas_threads):
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                     initializer=limit_blas_threads,
+                                     initargs=(blas_threads,)) as executor:
+                timings = list(executor.map(batched_matmul, groups.keys(), groups.values(),
+                                            seeds, dtypes))
+
+    print(f"\n{'Size':>8} {'Count':>8} {'Seconds':>12}")
+    for size, count, elapsed in timings:
+        print(f"{size:>8} {count:>8} {elapsed:>12.6f}")
+    return timings
+
+
 def main():
     """Main function"""
     print("Hello from t1!")
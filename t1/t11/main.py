@@ -1,20 +1,148 @@
 """
 t11 - Data structures and algorithm operations
 """
+import bisect
+import heapq
+import math
+import os
+import random
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-class DataProcessor:
+SHARED_MEMORY_MIN_ITEMS = 1 << 16
+SHARE_CHUNK_ITEMS = 1 << 16
+SELECT_SORT_CUTOFF = 32
+DEFAULT_QUANTILE_ERROR = 0.0133
+VIEW_ALIVE_MESSAGE = "cannot add items while a view from get_items() is alive; release it first"
+
+
+class SortedIndexMixin:
+    """Lazily merged sorted index and memoized aggregates kept in step with `data`
+    
+    Appends only queue items for the index; the first query after them merges
+    the pending items in one pass. A processor whose `sorted_data` is None keeps
+    no index and answers queries from `data` directly.
+    """
+    
+    __slots__ = ()
+    
+    def sorted_index(self):
+        """Return the sorted index with pending appends merged in, or None if unindexed"""
+        if self.sorted_data is None:
+            return None
+        start = self.index_size
+        if start < len(self.data):
+            new_items = sorted(self.data[start:])
+            if isinstance(self.sorted_data, list):
+                # Two sorted runs: timsort merges them in linear time
+                self.sorted_data.extend(new_items)
+                self.sorted_data.sort()
+            else:
+                self.sorted_data = array(self.sorted_data.typecode,
+                                         heapq.merge(self.sorted_data, new_items))
+            self.index_size = len(self.data)
+        return self.sorted_data
+    
+    def sorted_items(self, reverse=False):
+        """Get items in sorted order"""
+        index = self.sorted_index()
+        if index is None:
+            return array(self.data.typecode, sorted(self.data, reverse=reverse))
+        return index[::-1] if reverse else index[:]
+    
+    def minimum(self):
+        """Smallest item"""
+        if not len(self.data):
+            return None
+        index = self.sorted_index()
+        return min(self.data) if index is None else index[0]
+    
+    def maximum(self):
+        """Largest item"""
+        if not len(self.data):
+            return None
+        index = self.sorted_index()
+        return max(self.data) if index is None else index[-1]
+    
+    def median(self):
+        """Upper median item"""
+        count = len(self.data)
+        if not count:
+            return None
+        index = self.sorted_index()
+        if index is not None:
+            return index[count // 2]
+        if 'median' not in self.cache:
+            self.cache['median'] = select_kth(self.data, count // 2)
+        return self.cache['median']
+    
+    def partition(self, threshold):
+        """Split items into (above, at-or-below) threshold, keeping insertion order"""
+        return partition_threshold(self.data, threshold)
+    
+    def split(self, threshold):
+        """Split sorted items into (above, at-or-below) threshold"""
+        index = self.sorted_index()
+        if index is None:
+            index = self.sorted_items()
+        idx = bisect.bisect_right(index, threshold)
+        return index[idx:], index[:idx]
+    
+    def count_above(self, threshold):
+        """Count items above threshold"""
+        index = self.sorted_index()
+        if index is None:
+            return sum(1 for x in self.data if x > threshold)
+        return len(index) - bisect.bisect_right(index, threshold)
+    
+    def total(self):
+        """Sum of all items (memoized until the next mutation)"""
+        if 'total' not in self.cache:
+            self.cache['total'] = sum(self.data)
+        return self.cache['total']
+    
+    def mean(self):
+        """Mean of all items"""
+        count = len(self.data)
+        return self.total() / count if count else None
+    
+    def statistics(self):
+        """Return (total, average, median) like compute_statistics"""
+        if not len(self.data):
+            return None, None, None
+        return self.total(), self.mean(), self.median()
+
+
+class DataProcessor(SortedIndexMixin):
     """Process and manage data structures"""
     
     def __init__(self):
         self.data = []
+        self.sorted_data = []
+        self.index_size = 0
         self.cache = {}
     
     def add_item(self, item):
         """Add item to data structure"""
         self.data.append(item)
+        self.cache.clear()
         return len(self.data)
     
+    def extend(self, items):
+        """Add many items at once"""
+        before = len(self.data)
+        self.data.extend(items)
+        self.cache.clear()
+        return len(self.data) - before
+    
     def get_items(self):
         """Get all items"""
         return self.data.copy()
@@ -22,96 +150,555 @@ class DataProcessor:
     def clear(self):
         """Clear all data"""
         self.data.clear()
+        self.sorted_data.clear()
+        self.index_size = 0
+        self.cache.clear()
+
+
+class CompactDataProcessor(SortedIndexMixin):
+    """Numeric data processor backed by a typed array instead of a list
+    
+    No sorted index is kept unless keep_index is set, so the items are stored
+    once; order queries then select or sort on demand.
+    """
+    
+    __slots__ = ('data', 'sorted_data', 'index_size', 'cache')
+    
+    def __init__(self, typecode='q', keep_index=False):
+        self.data = array(typecode)
+        self.sorted_data = array(typecode) if keep_index else None
+        self.index_size = 0
+        self.cache = {}
+    
+    def __len__(self):
+        return len(self.data)
+    
+    def add_item(self, item):
+        """Add item to data structure"""
+        try:
+            self.data.append(item)
+        except BufferError:
+            raise BufferError(VIEW_ALIVE_MESSAGE) from None
+        self.cache.clear()
+        return len(self.data)
+    
+    def extend(self, items):
+        """Add many items at once"""
+        before = len(self.data)
+        try:
+            if isinstance(items, array) and items.typecode == self.data.typecode:
+                self.data.extend(items)
+            else:
+                self.data.fromlist(list(items))
+        except BufferError:
+            raise BufferError(VIEW_ALIVE_MESSAGE) from None
         self.cache.clear()
+        return len(self.data) - before
+    
+    def get_items(self):
+        """Get a read-only, zero-copy view of all items (release it before adding more)"""
+        return memoryview(self.data).toreadonly()
+    
+    def clear(self):
+        """Clear all data"""
+        del self.data[:]
+        if self.sorted_data is not None:
+            del self.sorted_data[:]
+        self.index_size = 0
+        self.cache.clear()
+
+
+def numeric_array(dataset):
+    """Pack a numeric dataset into a typed array ('q', falling back to 'd'), or return None"""
+    try:
+        return array('q', dataset)
+    except OverflowError:
+        return None
+    except TypeError:
+        try:
+            return array('d', dataset)
+        except TypeError:
+            return None
 
 
-def create_processor():
+def create_processor(compact=False, typecode='q', keep_index=False):
     """Create and initialize data processor"""
+    if compact:
+        return CompactDataProcessor(typecode, keep_index=keep_index)
     processor = DataProcessor()
     return processor
 
 
 def populate_data(processor, items):
     """Populate processor with data"""
-    count = 0
-    for item in items:
-        processor.add_item(item)
-        count += 1
+    count = processor.extend(items)
     
     print(f"Added {count} items to processor")
     return count
 
 
+def create_populated_processor(dataset, compact=False, typecode=None):
+    """Create a processor holding dataset, inferring the compact typecode if not given"""
+    if compact and typecode is None:
+        data = numeric_array(dataset)
+        if data is not None:
+            dataset = data
+            typecode = data.typecode
+        else:
+            # Not representable as a typed array; keep the list-backed processor
+            compact = False
+    
+    processor = create_processor(compact=compact, typecode=typecode)
+    populate_data(processor, dataset)
+    return processor
+
+
+def is_numpy_array(data):
+    """Check whether data is a NumPy array"""
+    return HAS_NUMPY and isinstance(data, np.ndarray)
+
+
+def select_kth(data, k):
+    """Return the k-th smallest item (0-based) in expected O(n) time"""
+    if not 0 <= k < len(data):
+        raise IndexError(f"select index {k} out of range for {len(data)} items")
+    if is_numpy_array(data):
+        return np.partition(data, k)[k].item()
+    
+    items = data
+    # Introselect: quickselect, falling back to a sort if pivots keep going bad
+    depth_limit = 2 * len(items).bit_length()
+    while len(items) > SELECT_SORT_CUTOFF and depth_limit > 0:
+        depth_limit -= 1
+        samples = (items[0], items[len(items) // 2], items[-1])
+        pivot = sorted(samples)[1]
+        lows = [x for x in items if x < pivot]
+        if k < len(lows):
+            items = lows
+            continue
+        highs = [x for x in items if x > pivot]
+        equal_count = len(items) - len(lows) - len(highs)
+        if k < len(lows) + equal_count:
+            return pivot
+        k -= len(lows) + equal_count
+        items = highs
+    return sorted(items)[k]
+
+
+def percentile(data, q):
+    """Return the item at the q-th percentile (0-100) using linear-time selection"""
+    if not 0 <= q <= 100:
+        raise ValueError(f"percentile must be between 0 and 100, got {q}")
+    return select_kth(data, min(len(data) - 1, int(q / 100 * len(data))))
+
+
+def partition_threshold(data, threshold):
+    """Split data into (above, at-or-below) threshold in a single pass"""
+    if is_numpy_array(data):
+        mask = data > threshold
+        return data[mask], data[~mask]
+    
+    above = []
+    below = []
+    add_above = above.append
+    add_below = below.append
+    for x in data:
+        if x > threshold:
+            add_above(x)
+        else:
+            add_below(x)
+    return above, below
+
+
 def sort_data(data):
     """Sort data in multiple ways"""
-    sorted_asc = sorted(data)
-    sorted_desc = sorted(data, reverse=True)
+    if is_numpy_array(data):
+        sorted_asc = np.sort(data)
+    else:
+        sorted_asc = sorted(data)
+    sorted_desc = sorted_asc[::-1]
     
     return sorted_asc, sorted_desc
 
 
 def filter_data(data, threshold):
     """Filter data based on threshold"""
-    above = [x for x in data if x > threshold]
-    below = [x for x in data if x <= threshold]
+    above, below = partition_threshold(data, threshold)
     
     return above, below
 
 
 def analyze_data_structure(processor, threshold):
     """Analyze data structure contents"""
-    data = processor.get_items()
+    sorted_asc = processor.sorted_items()
     
-    if not data:
+    if not sorted_asc:
         print("No data to analyze")
         return None
     
-    sorted_asc, sorted_desc = sort_data(data)
-    above, below = filter_data(data, threshold)
+    above, below = processor.partition(threshold)
     
     print(f"Data analysis:")
-    print(f"  Total items: {len(data)}")
-    print(f"  Min: {min(data)}, Max: {max(data)}")
+    print(f"  Total items: {len(sorted_asc)}")
+    print(f"  Min: {processor.minimum()}, Max: {processor.maximum()}")
     print(f"  Above {threshold}: {len(above)}, Below: {len(below)}")
-    print(f"  Sorted (asc): {sorted_asc[:5]}...")
+    print(f"  Sorted (asc): {list(sorted_asc[:5])}...")
     
     return sorted_asc, above, below
 
 
 def compute_statistics(data):
     """Compute statistical measures"""
-    if not data:
+    if len(data) == 0:
         return None, None, None
     
-    total = sum(data)
+    total = data.sum().item() if is_numpy_array(data) else sum(data)
     average = total / len(data)
     median_idx = len(data) // 2
-    sorted_data = sorted(data)
-    median = sorted_data[median_idx]
+    if not isinstance(data, list) and not is_numpy_array(data):
+        data = list(data)
+    median = select_kth(data, median_idx)
     
     return total, average, median
 
 
-def process_multiple_datasets(datasets):
+def release_segment(shm):
+    """Close and remove a shared memory segment we created"""
+    shm.close()
+    shm.unlink()
+
+
+def copy_into_segment(buf, dataset, typecode):
+    """Pack dataset into buf chunk by chunk so no full-size intermediate copy is built"""
+    offset = 0
+    for start in range(0, len(dataset), SHARE_CHUNK_ITEMS):
+        chunk = array(typecode, dataset[start:start + SHARE_CHUNK_ITEMS])
+        nbytes = len(chunk) * chunk.itemsize
+        buf[offset:offset + nbytes] = memoryview(chunk).cast('B')
+        offset += nbytes
+
+
+def share_dataset(dataset):
+    """Copy a numeric dataset into shared memory, or return None if it is not numeric"""
+    length = len(dataset)
+    # 'q' and 'd' are both 8 bytes, so one segment fits either typecode
+    shm = shared_memory.SharedMemory(create=True, size=max(length * 8, 1))
+    try:
+        for typecode in ('q', 'd'):
+            try:
+                copy_into_segment(shm.buf, dataset, typecode)
+            except TypeError:
+                continue
+            except OverflowError:
+                break
+            return shm, typecode, length
+    except BaseException:
+        release_segment(shm)
+        raise
+    release_segment(shm)
+    return None
+
+
+def process_shared_dataset(name, typecode, length):
+    """Compute (total, avg, median) for a dataset held in shared memory"""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        if HAS_NUMPY:
+            # Read in place; the view must be gone before the segment is closed
+            data = np.frombuffer(shm.buf, dtype=np.dtype(typecode), count=length)
+            stats = compute_statistics(data)
+            del data
+        else:
+            data = array(typecode)
+            data.frombytes(shm.buf[:length * data.itemsize])
+            stats = compute_statistics(data)
+    finally:
+        shm.close()
+    return stats
+
+
+def process_dataset_items(dataset):
+    """Compute (total, avg, median) for a dataset passed by value"""
+    return compute_statistics(dataset)
+
+
+def process_datasets_parallel(datasets, max_workers=None):
+    """Process datasets across a process pool, returning stats in input order"""
+    results = []
+    in_flight = deque()
+    
+    def collect_oldest():
+        future, shm = in_flight.popleft()
+        try:
+            stats = future.result()
+        finally:
+            if shm is not None:
+                release_segment(shm)
+        if stats[0] is not None:
+            results.append(stats)
+    
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    # Bound the number of shared segments alive at once
+    window = 2 * max_workers
+    
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for dataset in datasets:
+                shared = share_dataset(dataset) if len(dataset) >= SHARED_MEMORY_MIN_ITEMS else None
+                if shared is not None:
+                    shm, typecode, length = shared
+                    try:
+                        future = executor.submit(process_shared_dataset, shm.name, typecode, length)
+                    except BaseException:
+                        release_segment(shm)
+                        raise
+                    in_flight.append((future, shm))
+                else:
+                    in_flight.append((executor.submit(process_dataset_items, dataset), None))
+                
+                if len(in_flight) >= window:
+                    collect_oldest()
+            
+            while in_flight:
+                collect_oldest()
+    finally:
+        # On failure the pool has shut down by now, so no worker still maps these
+        for _, shm in in_flight:
+            if shm is not None:
+                release_segment(shm)
+    
+    return results
+
+
+def process_multiple_datasets(datasets, compact=False, parallel=False, max_workers=None,
+                              typecode=None):
     """Process multiple datasets"""
+    if parallel:
+        return process_datasets_parallel(datasets, max_workers=max_workers)
+    
     results = []
     
     for idx, dataset in enumerate(datasets):
         print(f"\n--- Dataset {idx + 1} ---")
-        processor = create_processor()
-        populate_data(processor, dataset)
+        processor = create_populated_processor(dataset, compact=compact, typecode=typecode)
         
-        threshold = sum(dataset) / len(dataset)
+        threshold = processor.mean()
         analysis = analyze_data_structure(processor, threshold)
         
         if analysis:
-            total, avg, median = compute_statistics(dataset)
+            total, avg, median = processor.statistics()
             print(f"  Stats: total={total}, avg={avg:.2f}, median={median}")
             results.append((total, avg, median))
     
     return results
 
 
+class KLLSketch:
+    """Mergeable KLL quantile sketch with bounded memory"""
+    
+    def __init__(self, error=DEFAULT_QUANTILE_ERROR, seed=None):
+        # Empirical KLL bound: normalized rank error ~ 2.296 / k ** 0.9723
+        self.k = max(8, math.ceil((2.296 / error) ** (1 / 0.9723)))
+        self.error = error
+        self.count = 0
+        self.compactors = []
+        self.size = 0
+        self.max_size = 0
+        self.rng = random.Random(seed)
+        self.grow()
+    
+    def grow(self):
+        """Add a compactor level and recompute the capacity"""
+        self.compactors.append([])
+        self.max_size = sum(self.capacity(h) for h in range(len(self.compactors)))
+    
+    def capacity(self, height):
+        """Capacity of the compactor at a given level"""
+        depth = len(self.compactors) - height - 1
+        return math.ceil(self.k * (2 / 3) ** depth) + 1
+    
+    def update(self, item):
+        """Add one value"""
+        self.compactors[0].append(item)
+        self.count += 1
+        self.size += 1
+        if self.size >= self.max_size:
+            self.compress()
+    
+    def extend(self, items):
+        """Add many values"""
+        before = len(self.compactors[0])
+        self.compactors[0].extend(items)
+        added = len(self.compactors[0]) - before
+        self.count += added
+        self.size += added
+        while self.size >= self.max_size:
+            self.compress()
+    
+    def compress(self):
+        """Halve the first full compactor, promoting survivors one level up"""
+        for height in range(len(self.compactors)):
+            level = self.compactors[height]
+            if len(level) >= self.capacity(height):
+                if height + 1 >= len(self.compactors):
+                    self.grow()
+                level.sort()
+                # Keep an odd item behind so weights stay exact
+                leftover = [level.pop()] if len(level) % 2 else []
+                offset = self.rng.randrange(2)
+                self.compactors[height + 1].extend(level[offset::2])
+                self.compactors[height] = leftover
+                self.size = sum(len(c) for c in self.compactors)
+                if self.size < self.max_size:
+                    break
+    
+    def merge(self, other):
+        """Merge another sketch into this one"""
+        while len(self.compactors) < len(other.compactors):
+            self.grow()
+        for height, level in enumerate(other.compactors):
+            self.compactors[height].extend(level)
+        self.count += other.count
+        self.size = sum(len(c) for c in self.compactors)
+        while self.size >= self.max_size:
+            self.compress()
+        return self
+    
+    def rank(self, value):
+        """Approximate number of values <= value"""
+        return sum(
+            sum(1 for item in level if item <= value) << height
+            for height, level in enumerate(self.compactors)
+        )
+    
+    def quantile(self, q):
+        """Approximate q-quantile (0 <= q <= 1)"""
+        weighted = sorted(
+            (item, 1 << height)
+            for height, level in enumerate(self.compactors)
+            for item in level
+        )
+        if not weighted:
+            return None
+        target = q * sum(weight for _, weight in weighted)
+        cumulative = 0
+        for item, weight in weighted:
+            cumulative += weight
+            if cumulative > target:
+                return item
+        return weighted[-1][0]
+
+
+class StreamingStatistics:
+    """Online total/mean/min/max, threshold counts and a median sketch"""
+    
+    def __init__(self, threshold=None, error=DEFAULT_QUANTILE_ERROR, seed=None):
+        self.threshold = threshold
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.above = 0
+        self.sketch = KLLSketch(error=error, seed=seed)
+    
+    def update_chunk(self, chunk):
+        """Fold a chunk of values into the running statistics"""
+        if not chunk:
+            return
+        self.count += len(chunk)
+        self.total += sum(chunk)
+        low, high = min(chunk), max(chunk)
+        self.minimum = low if self.minimum is None else min(self.minimum, low)
+        self.maximum = high if self.maximum is None else max(self.maximum, high)
+        if self.threshold is not None:
+            self.above += sum(1 for x in chunk if x > self.threshold)
+        self.sketch.extend(chunk)
+    
+    def merge(self, other):
+        """Merge statistics gathered over another part of the stream"""
+        if other.threshold != self.threshold:
+            raise ValueError("Cannot merge statistics with different thresholds")
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.minimum = other.minimum if self.minimum is None else min(self.minimum, other.minimum)
+            self.maximum = other.maximum if self.maximum is None else max(self.maximum, other.maximum)
+        self.above += other.above
+        self.sketch.merge(other.sketch)
+        return self
+    
+    def mean(self):
+        """Mean of the values seen so far"""
+        return self.total / self.count if self.count else None
+    
+    def median(self):
+        """Approximate median"""
+        return self.sketch.quantile(0.5)
+    
+    def split_counts(self):
+        """Return (above, at-or-below) threshold counts, estimated if no threshold was fixed"""
+        if self.threshold is not None:
+            return self.above, self.count - self.above
+        below = min(self.sketch.rank(self.mean()), self.count)
+        return self.count - below, below
+    
+    def statistics(self):
+        """Return (total, average, median) like compute_statistics"""
+        if not self.count:
+            return None, None, None
+        return self.total, self.mean(), self.median()
+
+
+def iter_chunks(source, chunk_size=4096):
+    """Group a dataset into lists, passing through chunks that are already sized"""
+    chunk = []
+    for item in source:
+        if hasattr(item, '__len__'):
+            if chunk:
+                yield chunk
+                chunk = []
+            yield list(item)
+            continue
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def stream_statistics(source, threshold=None, error=DEFAULT_QUANTILE_ERROR, seed=None):
+    """Compute streaming statistics over an iterable of values or of chunks"""
+    stats = StreamingStatistics(threshold=threshold, error=error, seed=seed)
+    for chunk in iter_chunks(source):
+        stats.update_chunk(chunk)
+    return stats
+
+
+def process_streaming_datasets(datasets, threshold=None, error=DEFAULT_QUANTILE_ERROR):
+    """Process datasets in constant memory, returning approximate (total, avg, median)"""
+    results = []
+    
+    for idx, source in enumerate(datasets):
+        print(f"\n--- Dataset {idx + 1} (streaming) ---")
+        stats = stream_statistics(source, threshold=threshold, error=error)
+        if not stats.count:
+            print("No data to analyze")
+            continue
+        
+        above, below = stats.split_counts()
+        total, avg, median = stats.statistics()
+        print(f"  Total items: {stats.count}")
+        print(f"  Min: {stats.minimum}, Max: {stats.maximum}")
+        cutoff = threshold if threshold is not None else round(avg, 2)
+        print(f"  Above {cutoff}: {above}, Below: {below}")
+        print(f"  Stats: total={total}, avg={avg:.2f}, median~={median}")
+        results.append((total, avg, median))
+    
+    return results
+
+
 def aggregate_results(results):
     """Aggregate results from multiple datasets"""
     if not results:
@@ -127,11 +714,22 @@ def aggregate_results(results):
     return total_sum, avg_of_avgs
 
 
-def run_pipeline(datasets):
+def run_pipeline(datasets, compact=False, parallel=False, max_workers=None, typecode=None):
     """Run complete data processing pipeline"""
     print("Running data processing pipeline...")
     
-    results = process_multiple_datasets(datasets)
+    results = process_multiple_datasets(datasets, compact=compact, parallel=parallel,
+                                        max_workers=max_workers, typecode=typecode)
+    aggregated = aggregate_results(results)
+    
+    return aggregated
+
+
+def run_streaming_pipeline(datasets, threshold=None, error=DEFAULT_QUANTILE_ERROR):
+    """Run the data processing pipeline over streamed datasets"""
+    print("Running streaming data processing pipeline...")
+    
+    results = process_streaming_datasets(datasets, threshold=threshold, error=error)
     aggregated = aggregate_results(results)
     
     return aggregated
@@ -1,26 +1,58 @@
 """
 t111 - String manipulation and pattern matching
 """
+import mmap
 import re
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import repeat
+
+FILE_CHUNK_SIZE = 1 << 24
+VALIDATE_CHUNK_SIZE = 1 << 16
+TRANSFORM_CACHE_SIZE = 256
+# Texts longer than this are transformed without memoization; bounds the cache
+# to about TRANSFORM_CACHE_SIZE * 5 copies of this many characters
+TRANSFORM_CACHE_MAX_CHARS = 4096
+REGEX_METACHARS = frozenset('.^$*+?{}[]\\|()')
+
+SANITIZE_RE = re.compile(r'[^a-zA-Z0-9\s]')
+SANITIZE_RUN_RE = re.compile(r'[^a-zA-Z0-9\s]+')
+NUMBER_RE = re.compile(r'\d+')
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+# Emails are tried first; digits inside a matched email are recovered from the match
+SCAN_RE = re.compile(rf'(?P<email>{EMAIL_PATTERN})|(?P<number>\d+)')
+
+# Validators are applied with fullmatch, so they need no ^...$ anchors
+FORMAT_PATTERNS = {
+    'email': re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}'),
+    'phone': re.compile(r'\+?1?\d{9,15}'),
+    'url': re.compile(r'https?://[^\s]+'),
+    'number': re.compile(r'\d+'),
+}
+ANY_TEXT_RE = re.compile(r'.*', re.DOTALL)
+WHITESPACE_RE = re.compile(r'\s+')
 
 
 def sanitize_string(text):
     """Remove special characters from string"""
     # Remove non-alphanumeric except spaces
-    sanitized = re.sub(r'[^a-zA-Z0-9\s]', '', text)
+    sanitized = SANITIZE_RE.sub('', text)
     return sanitized
 
 
 def extract_numbers(text):
     """Extract all numbers from text"""
-    numbers = re.findall(r'\d+', text)
+    numbers = NUMBER_RE.findall(text)
     return [int(n) for n in numbers]
 
 
 def extract_emails(text):
     """Extract email addresses from text"""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
+    emails = EMAIL_RE.findall(text)
     return emails
 
 
@@ -33,24 +65,144 @@ def count_words(text):
     return word_count, unique_words
 
 
-def analyze_text_patterns(text):
+class TextScanner:
+    """Precompiled scanner that pulls numbers and emails out in one regex pass"""
+    
+    def __init__(self):
+        self.scan_re = SCAN_RE
+        self.number_re = NUMBER_RE
+        self.sanitize_run_re = SANITIZE_RUN_RE
+        self.texts_scanned = 0
+    
+    def scan(self, text):
+        """Return (word_count, unique_count, numbers, emails, sanitized_length)"""
+        words = text.split()
+        unique_count = len(set(map(str.lower, words)))
+        
+        numbers = []
+        emails = []
+        for match in self.scan_re.finditer(text):
+            email = match.group('email')
+            if email is None:
+                numbers.append(int(match.group()))
+            else:
+                emails.append(email)
+                numbers.extend(int(n) for n in self.number_re.findall(email))
+        
+        # Count removed characters without building the sanitized copy
+        removed = sum(map(len, self.sanitize_run_re.findall(text)))
+        self.texts_scanned += 1
+        return len(words), unique_count, numbers, emails, len(text) - removed
+
+
+DEFAULT_SCANNER = TextScanner()
+
+
+def analyze_text_patterns(text, scanner=None):
     """Analyze various patterns in text"""
-    sanitized = sanitize_string(text)
-    numbers = extract_numbers(text)
-    emails = extract_emails(text)
-    word_count, unique_count = count_words(text)
+    scanner = scanner or DEFAULT_SCANNER
+    word_count, unique_count, numbers, emails, sanitized_length = scanner.scan(text)
     
     print(f"Text analysis:")
     print(f"  Words: {word_count} (unique: {unique_count})")
     print(f"  Numbers found: {numbers}")
     print(f"  Emails found: {emails}")
-    print(f"  Sanitized length: {len(sanitized)}")
+    print(f"  Sanitized length: {sanitized_length}")
     
     return word_count, numbers, emails
 
 
+class AhoCorasick:
+    """Automaton that finds every occurrence of many literals in one pass"""
+    
+    def __init__(self, literals):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        for literal_id, literal in enumerate(literals):
+            node = 0
+            for char in literal:
+                child = self.goto[node].get(char)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][char] = child
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                node = child
+            self.output[node].append((literal_id, len(literal)))
+        self.build_failure_links()
+    
+    def build_failure_links(self):
+        """Compute failure links breadth-first and merge suffix outputs"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+    
+    def iter_matches(self, text):
+        """Yield (literal_id, start, end) for every (possibly overlapping) occurrence"""
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        node = 0
+        for idx, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for literal_id, length in output[node]:
+                yield literal_id, idx + 1 - length, idx + 1
+
+
+@lru_cache(maxsize=32)
+def build_automaton(literals):
+    """Build (and cache) an automaton for a tuple of literals"""
+    return AhoCorasick(literals)
+
+
+def is_literal_pattern(pattern):
+    """Check whether a pattern matches only itself"""
+    return isinstance(pattern, str) and bool(pattern) and not REGEX_METACHARS.intersection(pattern)
+
+
+def find_multiple_patterns(text, patterns):
+    """Find all occurrences of many patterns in one pass as (match, start, end, pattern_id)"""
+    patterns = tuple(patterns)
+    literal_ids = tuple(idx for idx, pattern in enumerate(patterns) if is_literal_pattern(pattern))
+    automaton = build_automaton(tuple(patterns[idx] for idx in literal_ids))
+    
+    results = []
+    last_end = {}
+    for literal_id, start, end in automaton.iter_matches(text):
+        pattern_id = literal_ids[literal_id]
+        # Match re.finditer: occurrences of one pattern never overlap
+        if start < last_end.get(pattern_id, 0):
+            continue
+        last_end[pattern_id] = end
+        results.append((text[start:end], start, end, pattern_id))
+    
+    for pattern_id, pattern in enumerate(patterns):
+        if not is_literal_pattern(pattern):
+            results.extend(
+                (m.group(), m.start(), m.end(), pattern_id)
+                for m in re.finditer(pattern, text)
+            )
+    
+    results.sort(key=lambda r: (r[1], r[3]))
+    return results
+
+
 def find_patterns(text, pattern):
-    """Find all occurrences of a pattern"""
+    """Find all occurrences of a pattern (or of a list of patterns in one pass)"""
+    if isinstance(pattern, (list, tuple)):
+        return find_multiple_patterns(text, pattern)
     matches = re.finditer(pattern, text)
     results = [(m.group(), m.start(), m.end()) for m in matches]
     
@@ -59,20 +211,117 @@ def find_patterns(text, pattern):
 
 def replace_pattern(text, pattern, replacement):
     """Replace pattern in text"""
-    replaced = re.sub(pattern, replacement, text)
-    count = len(re.findall(pattern, text))
+    replaced, count = re.subn(pattern, replacement, text)
     
     print(f"Replaced {count} occurrences of pattern")
     return replaced, count
 
 
-def process_text_data(texts):
+def compile_bytes_pattern(pattern):
+    """Compile a str, bytes or compiled pattern as a bytes regex"""
+    if isinstance(pattern, re.Pattern):
+        if isinstance(pattern.pattern, bytes):
+            return pattern
+        return re.compile(pattern.pattern.encode('utf-8'), pattern.flags & ~re.UNICODE)
+    if isinstance(pattern, str):
+        pattern = pattern.encode('utf-8')
+    return re.compile(pattern)
+
+
+@contextmanager
+def open_mapped(path):
+    """Memory-map a file read-only (empty files map to b'')"""
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield b''
+            return
+        try:
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+        finally:
+            mm.close()
+
+
+def release_scanned_pages(buffer, released, position, chunk_size):
+    """Drop mapped pages behind the scan once a full chunk has been passed"""
+    if position - released < chunk_size:
+        return released
+    if not isinstance(buffer, mmap.mmap) or not hasattr(mmap, 'MADV_DONTNEED'):
+        return position
+    boundary = position - position % mmap.PAGESIZE
+    if boundary > released:
+        buffer.madvise(mmap.MADV_DONTNEED, released, boundary - released)
+        released = boundary
+    return released
+
+
+def iter_chunked_matches(buffer, regex, chunk_size=FILE_CHUNK_SIZE):
+    """Lazily yield matches over a buffer, releasing pages behind the scan every chunk"""
+    # One scan over the whole mapping keeps matches exact across chunk boundaries;
+    # chunks only bound how much of the file stays resident
+    released = 0
+    for match in regex.finditer(buffer):
+        released = release_scanned_pages(buffer, released, match.start(), chunk_size)
+        yield match
+
+
+def find_patterns_in_file(path, pattern, chunk_size=FILE_CHUNK_SIZE):
+    """Lazily yield (match, start, end) byte offsets for a pattern in a file"""
+    regex = compile_bytes_pattern(pattern)
+    with open_mapped(path) as mm:
+        for match in iter_chunked_matches(mm, regex, chunk_size=chunk_size):
+            yield match.group(), match.start(), match.end()
+
+
+def extract_numbers_from_file(path, chunk_size=FILE_CHUNK_SIZE):
+    """Lazily yield (number, start, end) for every number in a file"""
+    for raw, start, end in find_patterns_in_file(path, NUMBER_RE, chunk_size=chunk_size):
+        yield int(raw), start, end
+
+
+def extract_emails_from_file(path, chunk_size=FILE_CHUNK_SIZE):
+    """Lazily yield (email, start, end) for every email address in a file"""
+    for raw, start, end in find_patterns_in_file(path, EMAIL_RE, chunk_size=chunk_size):
+        yield raw.decode('ascii'), start, end
+
+
+def replace_pattern_in_file(src_path, dst_path, pattern, replacement, chunk_size=FILE_CHUNK_SIZE):
+    """Stream a file to dst_path with pattern replaced, returning the replacement count"""
+    regex = compile_bytes_pattern(pattern)
+    if isinstance(replacement, str):
+        replacement = replacement.encode('utf-8')
+    
+    count = 0
+    with open_mapped(src_path) as mm, open(dst_path, 'wb') as out:
+        def copy_range(start, end):
+            for offset in range(start, end, chunk_size):
+                out.write(mm[offset:min(offset + chunk_size, end)])
+        
+        last = 0
+        for match in iter_chunked_matches(mm, regex, chunk_size=chunk_size):
+            # Flush the gap before the match in bounded pieces
+            copy_range(last, match.start())
+            out.write(match.expand(replacement))
+            last = match.end()
+            count += 1
+        copy_range(last, len(mm))
+    
+    print(f"Replaced {count} occurrences of pattern")
+    return count
+
+
+def process_text_data(texts, scanner=None):
     """Process multiple text samples"""
     results = []
+    scanner = scanner or TextScanner()
     
     for idx, text in enumerate(texts):
         print(f"\n--- Text {idx + 1} ---")
-        analysis = analyze_text_patterns(text)
+        analysis = analyze_text_patterns(text, scanner=scanner)
         results.append(analysis)
     
     return results
@@ -92,48 +341,96 @@ def summarize_text_analysis(results):
     return total_words, total_numbers, total_emails
 
 
+def normalize_whitespace(text):
+    """Replace runs of whitespace with a single space"""
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+
+TRANSFORMS = {
+    'upper': str.upper,
+    'lower': str.lower,
+    'title': str.title,
+    'normalized': normalize_whitespace,
+}
+
+
+class LazyTransforms(Mapping):
+    """Read-only mapping that computes each text transformation on first access"""
+    
+    def __init__(self, text):
+        self.text = text
+        self.computed = {}
+    
+    def __getitem__(self, name):
+        if name not in self.computed:
+            self.computed[name] = TRANSFORMS[name](self.text)
+        return self.computed[name]
+    
+    def __iter__(self):
+        return iter(TRANSFORMS)
+    
+    def __len__(self):
+        return len(TRANSFORMS)
+
+
+cached_transforms = lru_cache(maxsize=TRANSFORM_CACHE_SIZE)(LazyTransforms)
+
+
 def transform_text(text):
     """Apply various transformations to text"""
-    upper = text.upper()
-    lower = text.lower()
-    title = text.title()
-    
-    # Replace multiple spaces with single space
-    normalized = re.sub(r'\s+', ' ', text).strip()
+    if len(text) > TRANSFORM_CACHE_MAX_CHARS:
+        return LazyTransforms(text)
+    return cached_transforms(text)
+
+
+def transform_texts(texts, transforms=('normalized',)):
+    """Apply only the requested transformations to many texts"""
+    unknown = [name for name in transforms if name not in TRANSFORMS]
+    if unknown:
+        raise ValueError(f"Unknown transforms: {unknown}")
     
-    return {
-        'upper': upper,
-        'lower': lower,
-        'title': title,
-        'normalized': normalized
-    }
+    funcs = [(name, TRANSFORMS[name]) for name in transforms]
+    return [{name: func(text) for name, func in funcs} for text in texts]
+
+
+def get_format_pattern(format_type):
+    """Look up the compiled validator for a format (unknown formats accept anything)"""
+    return FORMAT_PATTERNS.get(format_type, ANY_TEXT_RE)
 
 
 def validate_format(text, format_type):
     """Validate text format"""
-    patterns = {
-        'email': r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$',
-        'phone': r'^\+?1?\d{9,15}$',
-        'url': r'^https?://[^\s]+$',
-        'number': r'^\d+$'
-    }
-    
-    pattern = patterns.get(format_type, '.*')
-    is_valid = bool(re.match(pattern, text))
+    is_valid = get_format_pattern(format_type).fullmatch(text) is not None
     
     return is_valid
 
 
-def batch_validate(texts, format_type):
+def validate_chunk(texts, format_type, return_mask=False):
+    """Validate a chunk of texts, returning a boolean mask or a valid count"""
+    fullmatch = get_format_pattern(format_type).fullmatch
+    mask = [fullmatch(text) is not None for text in texts]
+    return mask if return_mask else sum(mask)
+
+
+def batch_validate(texts, format_type, return_mask=False, parallel=False,
+                   chunk_size=VALIDATE_CHUNK_SIZE, max_workers=None):
     """Validate multiple texts"""
-    valid_count = 0
-    
-    for text in texts:
-        if validate_format(text, format_type):
-            valid_count += 1
+    if parallel and len(texts) > chunk_size:
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            parts = list(executor.map(validate_chunk, chunks, repeat(format_type),
+                                      repeat(return_mask)))
+        if return_mask:
+            result = [valid for part in parts for valid in part]
+            valid_count = sum(result)
+        else:
+            result = valid_count = sum(parts)
+    else:
+        result = validate_chunk(texts, format_type, return_mask=return_mask)
+        valid_count = sum(result) if return_mask else result
     
     print(f"Validation: {valid_count}/{len(texts)} valid {format_type}s")
-    return valid_count
+    return result
 
 
 def main():
@@ -1,7 +1,21 @@
 """
 t100 - Standalone project for testing and utilities
 """
+import heapq
+import math
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count as counter, islice, repeat
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    print("Warning: numpy not available")
+
+SIMULATION_BLOCK_ELEMENTS = 1 << 24
 
 
 def generate_random_numbers(count, min_val=1, max_val=100):
@@ -10,15 +24,40 @@ def generate_random_numbers(count, min_val=1, max_val=100):
     return numbers
 
 
-def shuffle_list(items):
+def integer_dtype(min_val, max_val):
+    """Smallest integer dtype that holds values in [min_val, max_val]"""
+    return np.result_type(np.min_scalar_type(min_val), np.min_scalar_type(max_val))
+
+
+def generate_random_array(shape, min_val=1, max_val=100, rng=None):
+    """Generate random integers in [min_val, max_val] as a NumPy array"""
+    if rng is None:
+        rng = np.random.default_rng()
+    return rng.integers(min_val, max_val, size=shape, endpoint=True,
+                        dtype=integer_dtype(min_val, max_val))
+
+
+def shuffle_list(items, in_place=False, rng=None):
     """Shuffle a list randomly"""
-    shuffled = items.copy()
+    if HAS_NUMPY and isinstance(items, np.ndarray):
+        if rng is None:
+            rng = np.random.default_rng()
+        if in_place:
+            rng.shuffle(items)
+            return items
+        return rng.permutation(items)
+    
+    shuffled = items if in_place else items.copy()
     random.shuffle(shuffled)
     return shuffled
 
 
 def sample_from_list(items, sample_size):
     """Sample random items from list"""
+    if not hasattr(items, '__len__'):
+        # Iterators and generators are sampled in one pass
+        return reservoir_sample(items, sample_size)
+    
     if sample_size > len(items):
         sample_size = len(items)
     
@@ -26,11 +65,237 @@ def sample_from_list(items, sample_size):
     return sampled
 
 
+def unit_random(rng):
+    """Draw a uniform value in the open interval (0, 1)"""
+    u = rng.random()
+    while u == 0.0:
+        u = rng.random()
+    return u
+
+
+def reservoir_skip(w, rng):
+    """Number of items Algorithm L passes over before the next replacement"""
+    if w >= 1.0:
+        return 0
+    return math.floor(math.log(unit_random(rng)) / math.log1p(-w))
+
+
+def reservoir_sample(iterable, k, rng=None):
+    """Sample k items from an iterator in one pass with O(k) memory (Algorithm L)"""
+    rng = rng or random
+    it = iter(iterable)
+    reservoir = list(islice(it, k))
+    if k <= 0 or len(reservoir) < k:
+        return reservoir
+    
+    exhausted = object()
+    w = math.exp(math.log(unit_random(rng)) / k)
+    while True:
+        skipped = reservoir_skip(w, rng)
+        # islice consumes the skipped items without materializing them
+        item = next(islice(it, skipped, skipped + 1), exhausted)
+        if item is exhausted:
+            return reservoir
+        reservoir[rng.randrange(k)] = item
+        w *= math.exp(math.log(unit_random(rng)) / k)
+
+
+class ReservoirSampler:
+    """Push-based Algorithm L reservoir for streams that arrive one item at a time"""
+    
+    __slots__ = ('k', 'rng', 'reservoir', 'seen', 'w', 'next_take')
+    
+    def __init__(self, k, rng=None):
+        self.k = k
+        self.rng = rng or random
+        self.reservoir = []
+        self.seen = 0
+        self.w = 1.0
+        self.next_take = 0
+    
+    def add(self, item):
+        """Offer one item to the reservoir"""
+        self.seen += 1
+        if len(self.reservoir) < self.k:
+            self.reservoir.append(item)
+            if len(self.reservoir) == self.k:
+                self.w = math.exp(math.log(unit_random(self.rng)) / self.k)
+                self.next_take = self.seen + reservoir_skip(self.w, self.rng) + 1
+        elif self.seen == self.next_take:
+            self.reservoir[self.rng.randrange(self.k)] = item
+            self.w *= math.exp(math.log(unit_random(self.rng)) / self.k)
+            self.next_take = self.seen + reservoir_skip(self.w, self.rng) + 1
+
+
+def weighted_reservoir_sample(iterable, k, weight=None, rng=None):
+    """Sample k items with probability proportional to weight (Efraimidis-Spirakis A-Res)"""
+    if k <= 0:
+        return []
+    rng = rng or random
+    heap = []
+    tie_breaker = counter()
+    for entry in iterable:
+        item, item_weight = (entry, weight(entry)) if weight else entry
+        if item_weight <= 0:
+            continue
+        # log(u) / w orders the same as u ** (1 / w) without underflow
+        key = math.log(unit_random(rng)) / item_weight
+        if len(heap) < k:
+            heapq.heappush(heap, (key, next(tie_breaker), item))
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, (key, next(tie_breaker), item))
+    return [item for _, _, item in sorted(heap, reverse=True)]
+
+
+def stratified_reservoir_sample(iterable, k, stratum, rng=None):
+    """Sample up to k items per stratum from one pass over an iterator"""
+    samplers = {}
+    for item in iterable:
+        key = stratum(item)
+        sampler = samplers.get(key)
+        if sampler is None:
+            sampler = samplers[key] = ReservoirSampler(k, rng=rng)
+        sampler.add(item)
+    return {key: sampler.reservoir for key, sampler in samplers.items()}
+
+
+class StatsAccumulator:
+    """Online count/sum/min/max/mean/variance that merges across chunks and workers"""
+    
+    __slots__ = ('count', 'total', 'minimum', 'maximum', 'mean', 'm2')
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def add(self, value):
+        """Add one value (Welford's update)"""
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        return self
+    
+    def update(self, values):
+        """Add a chunk of values, summarizing it first and then merging"""
+        if HAS_NUMPY and isinstance(values, np.ndarray):
+            if values.size == 0:
+                return self
+            integral = values.dtype.kind in 'iub'
+            total = values.sum(dtype=np.int64 if integral else np.float64).item()
+            mean = total / values.size
+            deviations = values.astype(np.float64) - mean
+            chunk = StatsAccumulator.from_dict({
+                'count': values.size,
+                'total': total,
+                'min': values.min().item(),
+                'max': values.max().item(),
+                'mean': mean,
+                'm2': float(np.dot(deviations.ravel(), deviations.ravel())),
+            })
+            return self.merge(chunk)
+        
+        chunk = StatsAccumulator()
+        for value in values:
+            chunk.add(value)
+        return self.merge(chunk)
+    
+    def merge(self, other):
+        """Merge another accumulator into this one (Chan et al. parallel update)"""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.total, self.mean, self.m2 = other.count, other.total, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return self
+        
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+    
+    @property
+    def variance(self):
+        """Population variance"""
+        return self.m2 / self.count if self.count else None
+    
+    def statistics(self):
+        """Return the calculate_statistics dict, plus variance"""
+        if not self.count:
+            return None
+        return {
+            'total': self.total,
+            'mean': self.total / self.count,
+            'min': self.minimum,
+            'max': self.maximum,
+            'count': self.count,
+            'variance': self.variance,
+        }
+    
+    def to_dict(self):
+        """Serialize to a plain dict that can cross process boundaries"""
+        return {
+            'count': self.count,
+            'total': self.total,
+            'min': self.minimum,
+            'max': self.maximum,
+            'mean': self.mean,
+            'm2': self.m2,
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild an accumulator from to_dict output"""
+        acc = cls()
+        acc.count = data['count']
+        acc.total = data['total']
+        acc.minimum = data['min']
+        acc.maximum = data['max']
+        acc.mean = data['mean']
+        acc.m2 = data['m2']
+        return acc
+
+
+def accumulate(values):
+    """Build an accumulator over a list or array of values"""
+    return StatsAccumulator().update(values)
+
+
+def calculate_batch_statistics(batch):
+    """Calculate statistics for each row of a 2-D array in one vectorized pass"""
+    count = batch.shape[1]
+    totals = batch.sum(axis=1, dtype=np.int64 if batch.dtype.kind in 'iub' else np.float64)
+    means = totals / count
+    minimums = batch.min(axis=1)
+    maximums = batch.max(axis=1)
+    return [
+        {'total': total, 'mean': mean, 'min': minimum, 'max': maximum, 'count': count}
+        for total, mean, minimum, maximum in zip(
+            totals.tolist(), means.tolist(), minimums.tolist(), maximums.tolist()
+        )
+    ]
+
+
 def calculate_statistics(numbers):
     """Calculate basic statistics"""
-    if not numbers:
+    if len(numbers) == 0:
         return None
     
+    if HAS_NUMPY and isinstance(numbers, np.ndarray):
+        return calculate_batch_statistics(numbers.reshape(1, -1))[0]
+    
     total = sum(numbers)
     mean = total / len(numbers)
     minimum = min(numbers)
@@ -58,10 +323,19 @@ def analyze_random_data(count):
     return numbers, stats
 
 
+def resolve_statistics(data):
+    """Get the stats dict for raw data, an accumulator or an existing stats dict"""
+    if isinstance(data, StatsAccumulator):
+        return data.statistics()
+    if isinstance(data, dict):
+        return data
+    return calculate_statistics(data)
+
+
 def compare_datasets(dataset1, dataset2):
     """Compare two datasets"""
-    stats1 = calculate_statistics(dataset1)
-    stats2 = calculate_statistics(dataset2)
+    stats1 = resolve_statistics(dataset1)
+    stats2 = resolve_statistics(dataset2)
     
     mean_diff = abs(stats1['mean'] - stats2['mean'])
     range_diff = abs((stats1['max'] - stats1['min']) - (stats2['max'] - stats2['min']))
@@ -73,8 +347,28 @@ def compare_datasets(dataset1, dataset2):
     return mean_diff, range_diff
 
 
-def run_simulations(num_simulations, data_size):
+def run_simulations_vectorized(num_simulations, data_size, rng=None, min_val=1, max_val=100):
+    """Run simulations as blocks of a (num_simulations, data_size) integer array"""
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    results = []
+    block_rows = max(1, SIMULATION_BLOCK_ELEMENTS // max(data_size, 1))
+    for start in range(0, num_simulations, block_rows):
+        rows = min(block_rows, num_simulations - start)
+        batch = generate_random_array((rows, data_size), min_val, max_val, rng=rng)
+        results.extend(calculate_batch_statistics(batch))
+    
+    return results
+
+
+def run_simulations(num_simulations, data_size, vectorized=False, rng=None):
     """Run multiple random data simulations"""
+    if vectorized and HAS_NUMPY:
+        results = run_simulations_vectorized(num_simulations, data_size, rng=rng)
+        print(f"Ran {num_simulations} vectorized simulations of {data_size} numbers")
+        return results
+    
     results = []
     
     for i in range(num_simulations):
@@ -85,10 +379,56 @@ def run_simulations(num_simulations, data_size):
     return results
 
 
+def simulate_streams(seed_sequences, data_size, min_val=1, max_val=100):
+    """Run one simulation per independent seed sequence"""
+    return [
+        calculate_statistics(generate_random_array(data_size, min_val, max_val,
+                                                   rng=np.random.default_rng(seed_seq)))
+        for seed_seq in seed_sequences
+    ]
+
+
+def run_parallel_simulations(num_simulations, data_size, seed=None, max_workers=None,
+                             chunk_size=None, min_val=1, max_val=100):
+    """Run simulations across a process pool with results reproducible from one root seed"""
+    if not HAS_NUMPY:
+        print("Numpy not available - parallel simulations disabled")
+        return []
+    
+    # Each simulation owns a spawned stream, so worker count never changes its numbers
+    root = np.random.SeedSequence(seed)
+    streams = root.spawn(num_simulations)
+    print(f"Running {num_simulations} simulations from root seed {root.entropy}")
+    
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(num_simulations / (max_workers * 4)))
+    chunks = [streams[i:i + chunk_size] for i in range(0, num_simulations, chunk_size)]
+    
+    if max_workers <= 1 or len(chunks) <= 1:
+        parts = [simulate_streams(chunk, data_size, min_val, max_val) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            parts = list(executor.map(simulate_streams, chunks, repeat(data_size),
+                                      repeat(min_val), repeat(max_val)))
+    
+    return [stats for part in parts for stats in part]
+
+
 def aggregate_simulation_results(results):
     """Aggregate results from simulations"""
-    avg_mean = sum(r['mean'] for r in results) / len(results)
-    avg_total = sum(r['total'] for r in results) / len(results)
+    means = StatsAccumulator()
+    totals = StatsAccumulator()
+    for result in results:
+        stats = resolve_statistics(result)
+        means.add(stats['mean'])
+        totals.add(stats['total'])
+    if not means.count:
+        print("No simulation results to aggregate")
+        return None
+    avg_mean = means.mean
+    avg_total = totals.mean
     
     print(f"\n=== Simulation Summary ===")
     print(f"Number of simulations: {len(results)}")
@@ -3,6 +3,9 @@ pkg1 - File system operations and path manipulation
 """
 import os
 import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+WALK_MAX_WORKERS = 32
 
 
 def get_directory_info(path):
@@ -27,6 +30,71 @@ def get_directory_info(path):
     return total_files, total_dirs, total_size
 
 
+def scan_directory(path, follow_symlinks=False):
+    """Scan one directory level, returning (files, dirs, size, subdirectories)"""
+    total_files = 0
+    total_dirs = 0
+    total_size = 0
+    subdirs = []
+    
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        total_dirs += 1
+                        # DirEntry caches this stat; its identity guards against loops
+                        st = entry.stat(follow_symlinks=follow_symlinks)
+                        subdirs.append((entry.path, (st.st_dev, st.st_ino)))
+                    elif entry.is_file(follow_symlinks=follow_symlinks):
+                        total_files += 1
+                        total_size += entry.stat(follow_symlinks=follow_symlinks).st_size
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    
+    return total_files, total_dirs, total_size, subdirs
+
+
+def walk_directory_tree(path, max_workers=WALK_MAX_WORKERS, follow_symlinks=False):
+    """Recursively total (files, dirs, size) for every subtree using a thread pool"""
+    if not os.path.isdir(path):
+        return None
+    
+    root_stat = os.stat(path)
+    visited = {(root_stat.st_dev, root_stat.st_ino)}
+    own = {}
+    parents = {}
+    order = [path]
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(scan_directory, path, follow_symlinks): path}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dir_path = pending.pop(future)
+                files, dirs, size, subdirs = future.result()
+                own[dir_path] = (files, dirs, size)
+                for sub_path, identity in subdirs:
+                    if identity in visited:
+                        continue
+                    visited.add(identity)
+                    parents[sub_path] = dir_path
+                    order.append(sub_path)
+                    pending[executor.submit(scan_directory, sub_path, follow_symlinks)] = sub_path
+    
+    # Children are always discovered after their parent, so roll up in reverse
+    totals = {dir_path: list(own[dir_path]) for dir_path in order}
+    for dir_path in reversed(order):
+        parent = parents.get(dir_path)
+        if parent is not None:
+            for idx, value in enumerate(totals[dir_path]):
+                totals[parent][idx] += value
+    
+    return {dir_path: tuple(values) for dir_path, values in totals.items()}
+
+
 def format_size(size_bytes):
     """Format bytes to human readable size"""
     for unit in ['B', 'KB', 'MB', 'GB']:
@@ -79,12 +147,28 @@ def check_environment():
     return env_info
 
 
-def scan_paths(paths):
+def analyze_directory_tree(path, max_workers=WALK_MAX_WORKERS):
+    """Analyze a directory and all of its subdirectories"""
+    subtrees = walk_directory_tree(path, max_workers=max_workers)
+    
+    if subtrees is None:
+        print(f"Directory not found: {path}")
+        return None
+    
+    files, dirs, size = subtrees[path]
+    print(f"Directory tree: {path}")
+    print(f"  Files: {files}, Directories: {dirs}")
+    print(f"  Total size: {format_size(size)}")
+    
+    return files, dirs, size
+
+
+def scan_paths(paths, recursive=False):
     """Scan multiple paths"""
     results = []
     
     for path in paths:
-        result = analyze_directory(path)
+        result = analyze_directory_tree(path) if recursive else analyze_directory(path)
         if result:
             results.append(result)
     